@@ -0,0 +1,63 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test import Client
+
+from notes.models import Note
+
+User = get_user_model()
+
+
+def get_session_cookie(user):
+    """Возвращает значение cookie сессии для авторизованного пользователя.
+
+    Сессия создаётся один раз на весь класс тестов, чтобы не выполнять
+    force_login перед каждым тестом.
+    """
+    client = Client()
+    client.force_login(user)
+    return client.cookies[settings.SESSION_COOKIE_NAME].value
+
+
+def get_logged_in_client(session_cookie):
+    """Возвращает клиент, авторизованный по готовой cookie сессии."""
+    client = Client()
+    client.cookies[settings.SESSION_COOKIE_NAME] = session_cookie
+    return client
+
+
+class NotesFixtureMixin:
+    """Общие тестовые данные для классов тестов приложения notes.
+
+    Перед каждым тестом создаёт клиенты author_client и reader_client,
+    авторизованные от имени автора и читателя; self.client остаётся
+    анонимным.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создаёт автора, читателя и заметку, принадлежащую автору.
+
+        Slug заметки не задаётся и формируется автоматически из заголовка.
+        """
+        super().setUpTestData()
+        cls.author = User.objects.create_user(
+            username="Автор",
+            password="password"
+        )
+        cls.reader = User.objects.create_user(
+            username="Читатель",
+            password="readerpassword"
+        )
+        cls.notes = Note.objects.create(
+            title="Заголовок",
+            text="text",
+            author=cls.author
+        )
+        cls.author_session_cookie = get_session_cookie(cls.author)
+        cls.reader_session_cookie = get_session_cookie(cls.reader)
+
+    def setUp(self):
+        """Создаёт авторизованные клиенты автора и читателя."""
+        super().setUp()
+        self.author_client = get_logged_in_client(self.author_session_cookie)
+        self.reader_client = get_logged_in_client(self.reader_session_cookie)
@@ -1,29 +1,25 @@
 from http import HTTPStatus
 
-from django.contrib.auth import get_user_model
-from django.test import Client, TestCase
+from django.test import TestCase
 from django.urls import reverse
 from pytils.translit import slugify
 
+from notes.forms import WARNING, NoteForm
 from notes.models import Note
+from notes.tests.common import NotesFixtureMixin
 
-User = get_user_model()
 
-
-class TestLogic(TestCase):
+class TestLogic(NotesFixtureMixin, TestCase):
     """Класс тестов для проверки логики создания заметок."""
 
     @classmethod
     def setUpTestData(cls):
-        """Создает тестового пользователя и данные для формы.
+        """Создает URL и данные формы для создания заметки.
 
-        Метод создаёт пользователя (автора), URL для создания и успешного
-        добавления заметки, а также данные формы для создания новой заметки.
+        Метод дополняет общие тестовые данные URL для создания и успешного
+        добавления заметки, а также данными формы для новой заметки.
         """
-        cls.author = User.objects.create_user(
-            username="Автор",
-            password="password"
-        )
+        super().setUpTestData()
         cls.create_url = reverse("notes:add")
         cls.success_url = reverse("notes:success")
         cls.form_data = {
@@ -31,10 +27,7 @@ class TestLogic(TestCase):
             "text": "New Text",
             "slug": "new-slug",
         }
-
-    def setUp(self):
-        """Авторизует тестового пользователя (автора) перед каждым тестом."""
-        self.client.force_login(self.author)
+        cls.initial_note_count = Note.objects.count()
 
     def create_note_as_authenticated_user(self):
         """Создает заметку от имени авторизованного пользователя.
@@ -42,7 +35,7 @@ class TestLogic(TestCase):
         Returns:
             HttpResponse: Ответ на запрос создания заметки.
         """
-        return self.client.post(self.create_url, data=self.form_data)
+        return self.author_client.post(self.create_url, data=self.form_data)
 
     def test_authenticated_user_can_create_note(self):
         """Проверяет, что авторизованный пользователь может создать заметку.
@@ -51,10 +44,9 @@ class TestLogic(TestCase):
         статус ответа равен HTTP 302 (FOUND),
         а количество заметок увеличивается на единицу.
         """
-        initial_note_count = Note.objects.count()
         response = self.create_note_as_authenticated_user()
         self.assertEqual(response.status_code, HTTPStatus.FOUND)
-        self.assertEqual(Note.objects.count(), initial_note_count + 1)
+        self.assertEqual(Note.objects.count(), self.initial_note_count + 1)
 
     def test_anonymous_user_cannot_create_note(self):
         """Проверяет, что анонимный пользователь не может создать заметку.
@@ -63,11 +55,9 @@ class TestLogic(TestCase):
         возвращает статус ответа HTTP 302 (FOUND),
         а количество заметок остаётся неизменным.
         """
-        self.client.logout()
-        initial_note_count = Note.objects.count()
         response = self.client.post(self.create_url, data=self.form_data)
         self.assertEqual(response.status_code, HTTPStatus.FOUND)
-        self.assertEqual(Note.objects.count(), initial_note_count)
+        self.assertEqual(Note.objects.count(), self.initial_note_count)
 
     def test_empty_slug(self):
         """Проверяет автоматическую генерацию slug, если он не заполнен.
@@ -78,44 +68,38 @@ class TestLogic(TestCase):
         self.form_data.pop("slug")
         response = self.create_note_as_authenticated_user()
         self.assertRedirects(response, self.success_url)
-        new_note = Note.objects.latest("id")
-        self.assertEqual(new_note.slug, slugify(self.form_data["title"]))
+        new_slug = Note.objects.order_by("-id").values_list(
+            "slug", flat=True
+        ).first()
+        self.assertEqual(new_slug, slugify(self.form_data["title"]))
 
     def test_unique_slug_for_note(self):
         """Проверяет уникальность slug при создании заметок.
 
-        Убеждается, что невозможно создать две заметки с одинаковым slug, и
-        что в случае попытки создать заметку с повторяющимся slug статус ответа
-        будет HTTP 200 (OK).
+        Убеждается, что невозможно создать две заметки с одинаковым slug:
+        форма с повторяющимся slug не проходит валидацию и возвращает
+        ошибку в поле slug.
         """
         self.create_note_as_authenticated_user()
-        response = self.create_note_as_authenticated_user()
-        self.assertEqual(response.status_code, HTTPStatus.OK)
+        form = NoteForm(data=self.form_data)
+        self.assertFalse(form.is_valid())
+        self.assertEqual(
+            form.errors["slug"], [self.form_data["slug"] + WARNING]
+        )
         note_count = Note.objects.filter(slug=self.form_data["slug"]).count()
         self.assertEqual(note_count, 1)
 
 
-class TestNoteEditDelete(TestCase):
+class TestNoteEditDelete(NotesFixtureMixin, TestCase):
     """Класс тестов для проверки прав на редактирование и удаление заметок."""
 
     @classmethod
     def setUpTestData(cls):
-        """Создаёт тестовых пользователей и заметку для тестов.
+        """Определяет URL для редактирования и удаления заметки.
 
-        Метод создаёт автора заметки и читателя, а также заметку,
-        принадлежащую автору. Определяет URL для редактирования и удаления
-        заметки.
+        Автор, читатель и заметка автора создаются в общих тестовых данных.
         """
-        cls.author = User.objects.create_user(
-            username="Автор новости", password="password"
-        )
-        cls.reader = User.objects.create_user(
-            username="Читатель",
-            password="password"
-        )
-        cls.notes = Note.objects.create(
-            title="Заголовок", text="text", author=cls.author
-        )
+        super().setUpTestData()
         cls.edit_url = reverse("notes:edit", args=(cls.notes.slug,))
         cls.delete_url = reverse("notes:delete", args=(cls.notes.slug,))
         cls.success_url = reverse("notes:success")
@@ -125,13 +109,6 @@ class TestNoteEditDelete(TestCase):
             "slug": slugify("New Title"),
         }
 
-    def setUp(self):
-        """Авторизует тестовых пользователей перед каждым тестом."""
-        self.author_client = self.client
-        self.author_client.force_login(self.author)
-        self.reader_client = Client()
-        self.reader_client.force_login(self.reader)
-
     def test_author_can_delete_note(self):
         """Проверяет, что автор может удалить свою заметку.
 
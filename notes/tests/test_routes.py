@@ -1,53 +1,65 @@
 from http import HTTPStatus
 
-from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.urls import reverse
 
-from notes.models import Note
+from notes.tests.common import NotesFixtureMixin
 
-User = get_user_model()
 
-
-class TestRoutes(TestCase):
+class TestPublicRoutes(SimpleTestCase):
     @classmethod
-    def setUpTestData(cls):
-        cls.author = User.objects.create_user(
-            username="Автор",
-            password="password"
-        )
-        cls.reader = User.objects.create(
-            username="Читатель простой", password="readerpassword"
-        )
-        cls.notes = Note.objects.create(
-            title="title", text="text", slug="slug", author=cls.author
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.public_urls = (
+            reverse("users:login"),
+            reverse("users:logout"),
+            reverse("users:signup"),
         )
 
-    def setUp(self):
-        self.client.login(username="Автор", password="password")
-
     """Главная страница доступна анонимному пользователю"""
 
     def test_home_page(self):
         response = self.client.get("/")
         self.assertEqual(response.status_code, HTTPStatus.OK)
 
+    """Страницы регистрации пользователей,
+    входа в учётную запись и
+    выхода из неё доступны всем пользователям."""
+
+    def test_pages_availability_for_all_users(self):
+        for url in self.public_urls:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, HTTPStatus.OK)
+
+
+class TestAuthRoutes(NotesFixtureMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.login_url = reverse("users:login")
+        cls.pages_urls = (
+            reverse("notes:list"),
+            reverse("notes:success"),
+            reverse("notes:add"),
+        )
+        cls.note_urls = (
+            reverse("notes:edit", args=(cls.notes.slug,)),
+            reverse("notes:delete", args=(cls.notes.slug,)),
+            reverse("notes:detail", args=(cls.notes.slug,)),
+        )
+
     """Аутентифицированному пользователю доступна
       страница со списком заметок notes/,
       страница успешного добавления заметки done/,
       страница добавления новой заметки add/"""
 
     def test_pages_availability(self):
-        urls = (
-            "notes:list",
-            "notes:success",
-            "notes:add",
-        )
-        for name in urls:
-            with self.subTest(name=name):
-                url = reverse(name)
-                response = self.client.get(url)
-                self.assertEqual(response.status_code, HTTPStatus.OK)
+        with self.assertNumQueries(7):
+            for url in self.pages_urls:
+                with self.subTest(url=url):
+                    response = self.author_client.get(url)
+                    self.assertEqual(response.status_code, HTTPStatus.OK)
 
     """Страницы отдельной заметки,
     удаления и редактирования заметки
@@ -56,18 +68,16 @@ class TestRoutes(TestCase):
     вернётся ошибка 404."""
 
     def test_404_for_non_author_user(self):
-        users_statuses = (
-            (self.author, HTTPStatus.OK),
-            (self.reader, HTTPStatus.NOT_FOUND),
+        clients_statuses = (
+            (self.author_client, HTTPStatus.OK),
+            (self.reader_client, HTTPStatus.NOT_FOUND),
         )
-        self.client.logout()
-        for user, status in users_statuses:
-            self.client.force_login(user)
-            for name in ("notes:edit", "notes:delete", "notes:detail"):
-                with self.subTest(user=user, name=name):
-                    url = reverse(name, args=(self.notes.slug,))
-                    response = self.client.get(url)
-                    self.assertEqual(response.status_code, status)
+        for client, status in clients_statuses:
+            with self.assertNumQueries(9):
+                for url in self.note_urls:
+                    with self.subTest(status=status, url=url):
+                        response = client.get(url)
+                        self.assertEqual(response.status_code, status)
 
     """При попытке перейти на страницу списка заметок,
         страницу успешного добавления записи,
@@ -77,38 +87,12 @@ class TestRoutes(TestCase):
         перенаправляется на страницу логина."""
 
     def test_redirect_for_anonymous_user(self):
-        self.client.logout()
-
-        login_url = reverse("users:login")
-
-        protected_views = [
-            ("notes:list", None),
-            ("notes:success", None),
-            ("notes:add", None),
-            ("notes:edit", (self.notes.slug,)),
-            ("notes:delete", (self.notes.slug,)),
-            ("notes:detail", (self.notes.slug,)),
-        ]
-
-        for view_name, args in protected_views:
-            with self.subTest(view_name=view_name):
-                url = reverse(view_name, args=args)
-                expected_redirect_url = f"{login_url}?next={url}"
-                response = self.client.get(url)
-                self.assertRedirects(response, expected_redirect_url)
-
-    """Страницы регистрации пользователей,
-    входа в учётную запись и
-    выхода из неё доступны всем пользователям."""
-
-    def test_pages_availability_for_all_users(self):
-        urls = (
-            "users:login",
-            "users:logout",
-            "users:signup",
-        )
-        for name in urls:
-            with self.subTest(name=name):
-                url = reverse(name)
-                response = self.client.get(url)
-                self.assertEqual(response.status_code, HTTPStatus.OK)
+        for url in self.pages_urls + self.note_urls:
+            with self.subTest(url=url):
+                expected_redirect_url = f"{self.login_url}?next={url}"
+                response = self.client.head(url)
+                self.assertRedirects(
+                    response,
+                    expected_redirect_url,
+                    fetch_redirect_response=False
+                )
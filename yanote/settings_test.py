@@ -0,0 +1,13 @@
+from .settings import *  # noqa: F401, F403
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+DATABASES = {
+    **DATABASES,  # noqa: F405
+    'default': {
+        **DATABASES['default'],  # noqa: F405
+        'TEST': {'MIGRATE': False},
+    },
+}